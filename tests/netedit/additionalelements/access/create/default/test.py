@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'])
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'])
 
 # apply zoom
 netedit.setZoom("25", "0", "25")
@@ -58,4 +58,4 @@ netedit.saveAdditionals(referencePosition)
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -26,8 +26,8 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--sidewalks.guess', '--crossings.guess',
-                                                                            '--gui-testing-debug-gl'])
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--sidewalks.guess', '--crossings.guess',
+                                                            '--gui-testing-debug-gl'])
 
 # Recompute with volatile options
 netedit.rebuildNetworkWithVolatileOptions()
@@ -39,4 +39,4 @@ netedit.saveAdditionals(referencePosition)
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # force save additionals
 netedit.forceSaveAdditionals()
@@ -59,4 +59,4 @@ netedit.fixStoppingPlace("fixPositions")
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
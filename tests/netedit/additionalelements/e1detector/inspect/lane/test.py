@@ -15,55 +15,49 @@
 # @author  Pablo Alvarez Lopez
 # @date    2016-11-25
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
-
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'])
-
-# go to additional mode
-netedit.additionalMode()
-
-# select E1
-netedit.changeElement("inductionLoop")
-
-# create E1
-netedit.leftClick(referencePosition, 250, 210)
-
-# go to inspect mode
-netedit.inspectMode()
-
-# inspect first E1
-netedit.leftClick(referencePosition, 250, 210)
-
-# Change parameter lane with a non valid value (dummy lane)
-netedit.modifyAttribute(netedit.attrs.E1.inspect.lane, "dummy lane", True)
-
-# Change parameter lane with a valid value (different edge)
-netedit.modifyAttribute(netedit.attrs.E1.inspect.lane, "gneE0_0", True)
-
-# Change parameter lane with a valid value (original edge, same lane)
-netedit.modifyAttribute(netedit.attrs.E1.inspect.lane, "gneE2_1", True)
-
-# Change parameter lane with a valid value (original edge, different lane)
-netedit.modifyAttribute(netedit.attrs.E1.inspect.lane, "gneE2_0", True)
-
-# Check undos and redos
-netedit.undo(referencePosition, 4)
-netedit.redo(referencePosition, 4)
-
-# save additionals
-netedit.saveAdditionals(referencePosition)
-
-# save network
-netedit.saveNetwork(referencePosition)
-
-# quit netedit
-netedit.quit(neteditProcess)
+# extra parameters used for opening netedit
+NETEDIT_ARGS = []
+
+# test steps (see neteditTestFunctions.execute)
+TEST = [
+    # go to additional mode
+    ("additionalMode",),
+    # select E1
+    ("changeElement", "inductionLoop"),
+    # create E1
+    ("leftClick", 250, 210),
+    # go to inspect mode
+    ("inspectMode",),
+    # inspect first E1
+    ("leftClick", 250, 210),
+    # Change parameter lane with a non valid value (dummy lane)
+    ("modifyAttribute", "E1.inspect.lane", "dummy lane", True),
+    # Change parameter lane with a valid value (different edge)
+    ("modifyAttribute", "E1.inspect.lane", "gneE0_0", True),
+    # Change parameter lane with a valid value (original edge, same lane)
+    ("modifyAttribute", "E1.inspect.lane", "gneE2_1", True),
+    # Change parameter lane with a valid value (original edge, different lane)
+    ("modifyAttribute", "E1.inspect.lane", "gneE2_0", True),
+    # Check undos and redos
+    ("undoRedo", 4),
+    # save additionals
+    ("saveAdditionals",),
+    # save network
+    ("saveNetwork",),
+]
+
+
+def test_main(session):
+    session.execute(TEST)
+
+
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # first recompute
 netedit.rebuildNetwork()
@@ -53,4 +53,4 @@ netedit.saveNetwork(referencePosition)
 netedit.saveAdditionals(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
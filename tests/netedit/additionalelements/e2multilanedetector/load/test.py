@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'])
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'])
 
 # force save additionals
 netedit.forceSaveAdditionals()
@@ -48,4 +48,4 @@ netedit.saveAdditionals(referencePosition)
 netedit.typeSpace()
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -27,7 +27,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
 
 # open and close about dialog
 netedit.openAboutDialog()
@@ -36,4 +36,4 @@ netedit.openAboutDialog()
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit without search the pink square reference
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
 
 # open configuration using shortcut
 netedit.openConfigurationShortcut()
@@ -38,4 +38,4 @@ netedit.leftClick(referencePosition, 0, 0)
 netedit.saveNetworkAs()
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
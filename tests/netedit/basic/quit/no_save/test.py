@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -67,4 +67,4 @@ netedit.leftClick(referencePosition, 160, 210)
 netedit.typeEnter()
 
 # quit netedit without saving
-netedit.quit(neteditProcess, True, False, True, False, True, False)
+netedit.quit(True, False, True, False, True, False)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -73,4 +73,4 @@ netedit.saveNetwork(referencePosition)
 netedit.saveAdditionals(referencePosition)
 
 # quit netedit without saving demand
-netedit.quit(neteditProcess, False, False, False, False, True, False)
+netedit.quit(False, False, False, False, True, False)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -73,4 +73,4 @@ netedit.saveAdditionals(referencePosition)
 netedit.saveRoutes(referencePosition)
 
 # quit netedit without saving demand
-netedit.quit(neteditProcess, True, False, False, False, False, False)
+netedit.quit(True, False, False, False, False, False)
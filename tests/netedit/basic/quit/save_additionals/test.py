@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -73,4 +73,4 @@ netedit.saveNetwork(referencePosition)
 netedit.saveRoutes(referencePosition)
 
 # quit netedit saving all
-netedit.quit(neteditProcess, False, False, True, True, False, False)
+netedit.quit(False, False, True, True, False, False)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -67,4 +67,4 @@ netedit.leftClick(referencePosition, 160, 210)
 netedit.typeEnter()
 
 # quit netedits saving all
-netedit.quit(neteditProcess, True, True, True, True, True, True)
+netedit.quit(True, True, True, True, True, True)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -73,4 +73,4 @@ netedit.saveAdditionals(referencePosition)
 netedit.saveRoutes(referencePosition)
 
 # quit netedit saving all
-netedit.quit(neteditProcess, True, True, False, False, False, False)
+netedit.quit(True, True, False, False, False, False)
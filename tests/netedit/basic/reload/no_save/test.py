@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -67,10 +67,10 @@ netedit.leftClick(referencePosition, 160, 210)
 netedit.typeEnter()
 
 # reload netedit without saving
-netedit.reload(neteditProcess, True, False, True, False, True, False)
+netedit.reload(True, False, True, False, True, False)
 
 # click over view again
 netedit.leftClick(referencePosition, 0, 0)
 
 # quit netedit without saving
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -73,10 +73,10 @@ netedit.saveAdditionals(referencePosition)
 netedit.saveRoutes(referencePosition)
 
 # reload netedit without saving demand
-netedit.reload(neteditProcess, True, False, False, False, False, False)
+netedit.reload(True, False, False, False, False, False)
 
 # click over view again
 netedit.leftClick(referencePosition, 0, 0)
 
 # quit netedit
-netedit.quit(neteditProcess, False, False, False, False, False, False)
+netedit.quit(False, False, False, False, False, False)
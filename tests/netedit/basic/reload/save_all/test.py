@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -67,10 +67,10 @@ netedit.leftClick(referencePosition, 160, 210)
 netedit.typeEnter()
 
 # reload netedits saving all
-netedit.reload(neteditProcess, True, True, True, True, True, True)
+netedit.reload(True, True, True, True, True, True)
 
 # click over view again
 netedit.leftClick(referencePosition, 0, 0)
 
 # quit netedit
-netedit.quit(neteditProcess, False, False, False, False, False, False)
+netedit.quit(False, False, False, False, False, False)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
 
 # Change to create mode
 netedit.createEdgeMode()
@@ -43,4 +43,4 @@ netedit.redo(referencePosition, 1)
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # zoom in central node
 netedit.setZoom("50", "50", "50")
@@ -91,4 +91,4 @@ netedit.saveNetwork(referencePosition)
 netedit.typeSpace()
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -26,10 +26,10 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # save network
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess, True, True, True, False)
+netedit.quit(True, True, True, False)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, [], False)
+referencePosition = netedit.setupAndStart(neteditTestRoot, [], False)
 
 # go to select mode
 netedit.selectMode()
@@ -64,4 +64,4 @@ netedit.redo(referencePosition, 2)
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Eclipse SUMO, Simulation of Urban MObility; see https://eclipse.org/sumo
+# Copyright (C) 2009-2022 German Aerospace Center (DLR) and others.
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# https://www.eclipse.org/legal/epl-2.0/
+# This Source Code may also be made available under the following Secondary
+# Licenses when the conditions for such availability set forth in the Eclipse
+# Public License 2.0 are satisfied: GNU General Public License, version 2
+# or later which is available at
+# https://www.gnu.org/licenses/old-licenses/gpl-2.0-standalone.html
+# SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-or-later
+
+# @file    conftest.py
+# @author  Pablo Alvarez Lopez
+# @date    2022-12-14
+
+"""
+pytest fixtures for the netedit tests. Only the test.py scripts which define a
+test_main function are collected, neteditTestFunctions is imported once per
+pytest process. With pytest-xdist (pytest -n auto) every worker starts its own
+Xvfb display, the same way run_parallel.py does. After every test netedit is
+quit and the captured outputs are compared against the *.netedit references
+(see run_parallel.compareOutputs).
+Tests which end with unsaved changes declare the dialog flags of
+neteditTestFunctions.quit as NETEDIT_QUIT_FLAGS next to NETEDIT_ARGS.
+With --pool netedit processes are recycled between tests started with the same
+call (see neteditTestFunctions.setupAndStartPooled) and reload the input files
+of the next test once its sandbox is filled. Their outputs cannot be assigned
+to a single test and are not compared, so --pool is only meant for quick local
+runs.
+"""
+import atexit
+import os
+import shutil
+import sys
+
+import pytest
+
+_NETEDIT_TEST_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(_NETEDIT_TEST_ROOT)
+import run_parallel  # noqa
+
+# pyautogui connects to the display during import, so the display of a xdist worker must be set before
+if "PYTEST_XDIST_WORKER" in os.environ:
+    os.environ["DISPLAY"] = ":%s" % (90 + int(os.environ["PYTEST_XDIST_WORKER"].lstrip("gw")))
+    atexit.register(run_parallel.stopDisplay, run_parallel.startDisplay(os.environ["DISPLAY"]))
+
+import neteditTestFunctions as netedit  # noqa
+
+
+def pytest_addoption(parser):
+    parser.addoption("--pool", action="store_true", default=False,
+                     help="recycle netedit between tests instead of quitting it (outputs are not compared)")
+
+
+def pytest_collect_file(parent, file_path):
+    """
+    @brief collect only the test.py scripts which were converted to a test_main function
+    """
+    if file_path.name == "test.py" and "\ndef test_main(" in file_path.read_text():
+        return pytest.Module.from_parent(parent, path=file_path)
+
+
+@pytest.fixture(scope="session")
+def _sandbox(tmp_path_factory):
+    # pooled netedit processes are only reused if they write into the same sandbox
+    return tmp_path_factory.mktemp("sandbox")
+
+
+@pytest.fixture
+def session(request, _sandbox, monkeypatch, capfd):
+    usePool = request.config.getoption("--pool")
+    testDir = str(request.path.parent)
+    # fill sandbox with the input files of the test (before a pooled netedit reloads them)
+    shutil.rmtree(str(_sandbox))
+    _sandbox.mkdir()
+    run_parallel.fillSandbox(testDir, str(_sandbox), run_parallel.getCopiedFiles())
+    monkeypatch.setattr(netedit, "_TEXTTEST_SANDBOX", str(_sandbox))
+    monkeypatch.chdir(_sandbox)
+    # Open netedit
+    extraParameters = getattr(request.module, "NETEDIT_ARGS", [])
+    quitFlags = getattr(request.module, "NETEDIT_QUIT_FLAGS", [])
+    if usePool:
+        session = netedit.NeteditSession(*netedit.setupAndStartPooled(netedit.NETEDIT_TEST_ROOT, extraParameters))
+    else:
+        session = netedit.NeteditSession.start(netedit.NETEDIT_TEST_ROOT, extraParameters)
+    yield session
+    # recycle or quit netedit
+    if usePool:
+        session.recycle(*quitFlags)
+    else:
+        session.quit(*quitFlags)
+        # compare outputs (netedit is closed, so they include its destructor messages)
+        stdout, stderr = capfd.readouterr()
+        differences = run_parallel.compareOutputs(testDir, str(_sandbox), stdout, stderr)
+        if differences:
+            pytest.fail("output differs from reference\n" + differences, pytrace=False)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # Go to data supermode
 netedit.supermodeData()
@@ -68,4 +68,4 @@ netedit.saveDatas(referencePosition, True, 0, 30)
 netedit.saveNetwork(referencePosition, True, 0, 30)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
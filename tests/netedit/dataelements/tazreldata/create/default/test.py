@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # force save additionals
 netedit.forceSaveAdditionals()
@@ -62,4 +62,4 @@ netedit.saveNetwork(referencePosition, True, 0, 30)
 netedit.saveAdditionals(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -15,130 +15,100 @@
 # @author  Pablo Alvarez Lopez
 # @date    2019-07-16
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
+# extra parameters used for opening netedit
+NETEDIT_ARGS = []
 
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'])
 
-# go to demand mode
-netedit.supermodeDemand()
+def test_main(session):
+    # attributes used in this test
+    terminateAttribute = session.attrs.flowJunction.create.terminate
+    endAttribute = session.attrs.flowJunction.create.end
+    numberAttribute = session.attrs.flowJunction.create.number
 
-# go to vehicle mode
-netedit.vehicleMode()
+    # go to demand mode
+    session.supermodeDemand()
 
-# select flow with embedded route
-netedit.changeElement("flow (from-to junctions)")
+    # go to vehicle mode
+    session.vehicleMode()
 
-# set invalid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.terminate, "dummyTerminate")
+    # select flow with embedded route
+    session.changeElement("flow (from-to junctions)")
 
-# try to create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
+    # set invalid arrival pos
+    session.changeDefaultValue(terminateAttribute, "dummyTerminate")
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
+    # try to create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# set invalid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.terminate, "end-number")
+    # set invalid arrival pos
+    session.changeDefaultValue(terminateAttribute, "end-number")
 
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
+    # set valid arrival pos
+    session.changeDefaultValue(endAttribute, "dummy")
 
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.end, "dummy")
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
+    # set valid arrival pos
+    session.changeDefaultValue(endAttribute, "-30")
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.end, "-30")
+    # set valid arrival pos
+    session.changeDefaultValue(endAttribute, "20.5")
 
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
+    # set valid arrival pos
+    session.changeDefaultValue(endAttribute, "22")
 
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.end, "20.5")
+    # set valid arrival pos
+    session.changeDefaultValue(numberAttribute, "dummy")
 
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
+    # set valid arrival pos
+    session.changeDefaultValue(numberAttribute, "-30")
 
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.end, "22")
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.number, "dummy")
+    # set valid arrival pos
+    session.changeDefaultValue(numberAttribute, "20.5")
 
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
+    # set valid arrival pos
+    session.changeDefaultValue(numberAttribute, "51")
 
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.number, "-30")
+    # create flow with embedded route
+    session.createFlow(80, 360, 85, 77)
 
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
+    # Check undo redo
+    session.undo(5)
+    session.redo(5)
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
+    # save routes
+    session.saveRoutes()
 
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.number, "20.5")
+    # save network
+    session.saveNetwork()
 
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
 
-# press enter to create flow with embedded route
-netedit.typeEnter()
-
-# set valid arrival pos
-netedit.changeDefaultValue(netedit.attrs.flowJunction.create.number, "51")
-
-# create flow with embedded route
-netedit.leftClick(referencePosition, 80, 360)
-netedit.leftClick(referencePosition, 85, 77)
-
-# press enter to create flow with embedded route
-netedit.typeEnter()
-
-# Check undo redo
-netedit.undo(referencePosition, 5)
-netedit.redo(referencePosition, 5)
-
-# save routes
-netedit.saveRoutes(referencePosition)
-
-# save network
-netedit.saveNetwork(referencePosition)
-
-# quit netedit
-netedit.quit(neteditProcess)
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
@@ -17,20 +17,36 @@
 
 # Import libraries
 from __future__ import print_function
+import atexit
+import functools
 import os
 import sys
 try:
     import subprocess32 as subprocess
 except ImportError:
     import subprocess
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 import pyautogui
 import time
 import pyperclip
 import attributesEnum as attrs  # noqa
+try:
+    from Xlib import X, XK
+    from Xlib.display import Display
+    from Xlib.ext import xtest
+    # single connection to the X server used by the batch helpers (clickBatch, typeTwoKeysRepeated)
+    _XDISPLAY = Display()
+except Exception:
+    # python-xlib or X server not available (Windows, macOS), use only pyautogui
+    _XDISPLAY = None
 
 # define delay before every operation
 DELAY_KEY = 0.2
 DELAY_KEY_TAB = 0.2
+DELAY_KEY_REPEAT = 0.02
 DELAY_MOUSE_MOVE = 0.5
 DELAY_MOUSE_CLICK = 1
 DELAY_QUESTION = 3
@@ -44,15 +60,59 @@ DELAY_REMOVESELECTION = 2
 DELAY_CHANGEMODE = 1
 DELAY_REFERENCE = 15
 
+# all vClasses (used for testing allow/disallow attributes)
+ALL_VCLASSES = ("emergency authority army vip passenger hov bus coach tram rail_urban rail " +
+                "rail_electric motorcycle moped pedestrian custom1")
+# vClasses with different separators (used for testing the parsing of allow/disallow attributes)
+VCLASS_SEP_TEST = "authority  army, passenger; taxi. tram"
+
+# test roots, computed once when the module is imported
+SUMO_HOME = os.environ.get('SUMO_HOME', '.')
+NETEDIT_TEST_ROOT = os.path.join(os.environ.get('TEXTTEST_HOME', os.path.join(SUMO_HOME, 'tests')), 'netedit')
+
 _NETEDIT_APP = os.environ.get("NETEDIT_BINARY", "netedit")
 _TEXTTEST_SANDBOX = os.environ.get("TEXTTEST_SANDBOX", os.getcwd())
 _REFERENCE_PNG = os.path.join(os.path.dirname(__file__), "reference.png")
 
+# X keysyms of the pyautogui key names sent through _XDISPLAY by typeTwoKeysRepeated
+_XKEYSYMS = {'enter': 'Return', 'esc': 'Escape', 'space': 'space', 'tab': 'Tab', 'del': 'Delete',
+             'backspace': 'BackSpace', 'up': 'Up', 'down': 'Down', 'left': 'Left', 'right': 'Right',
+             'ctrl': 'Control_L', 'control': 'Control_L', 'shift': 'Shift_L', 'alt': 'Alt_L'}
+_XKEYSYMS.update([(c, c) for c in "abcdefghijklmnopqrstuvwxyz0123456789"])
+_XKEYSYMS.update([("F%s" % i, "F%s" % i) for i in range(1, 13)])
+
+# netedit process opened by setupAndStart (used by reload and quit)
+_NETEDIT_PROCESS = None
+
+# pool of started netedit processes, keyed by the netedit call (see setupAndStartPooled)
+_POOL = {}
+
 #################################################
 # interaction functions
 #################################################
 
 
+def getXKeycode(key):
+    """
+    @brief obtain the X keycode of a pyautogui key name (0 if the key has to be sent using pyautogui)
+    """
+    if _XDISPLAY is None or key not in _XKEYSYMS:
+        return 0
+    return _XDISPLAY.keysym_to_keycode(XK.string_to_keysym(_XKEYSYMS[key]))
+
+
+def sendXEvents(events):
+    """
+    @brief send a list of fake input events (type, detail) to the X server and flush them at once
+    """
+    for eventType, detail in events:
+        if eventType == X.MotionNotify:
+            xtest.fake_input(_XDISPLAY, eventType, x=detail[0], y=detail[1])
+        else:
+            xtest.fake_input(_XDISPLAY, eventType, detail)
+    _XDISPLAY.sync()
+
+
 def typeKeyUp(key):
     """
     @brief type single key up
@@ -159,6 +219,32 @@ def typeTwoKeys(key1, key2):
     typeKeyUp(key1)
 
 
+def typeTwoKeysRepeated(key1, key2, number):
+    """
+    @brief type key2 several times while key1 is pressed (key1 -> key2 x number)
+    """
+    keycode1 = getXKeycode(key1)
+    keycode2 = getXKeycode(key2)
+    if keycode1 and keycode2:
+        # press key 1
+        sendXEvents([(X.KeyPress, keycode1)])
+        # type key 2 with a small delay between repetitions
+        for _ in range(number):
+            sendXEvents([(X.KeyPress, keycode2), (X.KeyRelease, keycode2)])
+            time.sleep(DELAY_KEY_REPEAT)
+        # leave key 1
+        sendXEvents([(X.KeyRelease, keycode1)])
+    else:
+        # press key 1
+        typeKeyDown(key1)
+        # type key 2 with a small delay between repetitions
+        pyautogui.press(key2, presses=number, interval=DELAY_KEY_REPEAT)
+        # leave key 1
+        typeKeyUp(key1)
+    # wait before every operation
+    time.sleep(DELAY_KEY)
+
+
 def typeThreeKeys(key1, key2, key3):
     """
     @brief type three keys at the same time (key1 -> key2 -> key3)
@@ -217,6 +303,27 @@ def leftClick(referencePosition, positionx, positiony):
     print("TestFunctions: Clicked over position", clickedPosition[0], '-', clickedPosition[1])
 
 
+def clickBatch(referencePosition, positions, finalKey=None):
+    """
+    @brief do consecutive left clicks over positions relative to referencePosition (pink square)
+           and optionally type a final key (for example 'enter')
+    """
+    for positionx, positiony in positions:
+        # obtain clicked position
+        clickedPosition = [referencePosition[0] + positionx, referencePosition[1] + positiony]
+        # move mouse and click over position at once (without waiting after move)
+        if _XDISPLAY is not None:
+            sendXEvents([(X.MotionNotify, clickedPosition), (X.ButtonPress, 1), (X.ButtonRelease, 1)])
+        else:
+            pyautogui.click(clickedPosition[0], clickedPosition[1], button='left')
+        # wait after every click
+        time.sleep(DELAY_MOUSE_CLICK)
+        print("TestFunctions: Clicked over position", clickedPosition[0], '-', clickedPosition[1])
+    # type final key
+    if finalKey:
+        typeKey(finalKey)
+
+
 def leftClickShift(referencePosition, positionx, positiony):
     """
     @brief do left click over a position relative to referencePosition (pink square) while shift key is pressed
@@ -311,9 +418,9 @@ def dragDrop(referencePosition, x1, y1, x2, y2):
 #################################################
 
 
-def Popen(extraParameters, debugInformation):
+def buildNeteditCall(extraParameters, debugInformation):
     """
-    @brief open netedit
+    @brief build the command line used for opening netedit
     """
     # set the default parameters of Netedit
     neteditCall = [_NETEDIT_APP, '--gui-testing', '--window-pos', '50,50',
@@ -376,8 +483,16 @@ def Popen(extraParameters, debugInformation):
     # add extra parameters
     neteditCall += extraParameters
 
+    return neteditCall
+
+
+def Popen(extraParameters, debugInformation):
+    """
+    @brief open netedit
+    """
     # return a subprocess with Netedit
-    return subprocess.Popen(neteditCall, env=os.environ, stdout=sys.stdout, stderr=sys.stderr)
+    return subprocess.Popen(buildNeteditCall(extraParameters, debugInformation),
+                            env=os.environ, stdout=sys.stdout, stderr=sys.stderr)
 
 
 def getReferenceMatch(neProcess, makeScrenshot):
@@ -432,14 +547,15 @@ def getReferenceMatch(neProcess, makeScrenshot):
 
 def setupAndStart(testRoot, extraParameters=[], debugInformation=True, makeScrenshot=True):
     """
-    @brief setup and start netedit
+    @brief setup and start netedit, return the reference position
     """
+    global _NETEDIT_PROCESS
     if os.name == "posix":
         # to work around non working gtk clipboard
         pyperclip.set_clipboard("xclip")
     # Open Netedit
-    neteditProcess = Popen(extraParameters, debugInformation)
-    # atexit.register(quit, neteditProcess, False, False)
+    _NETEDIT_PROCESS = Popen(extraParameters, debugInformation)
+    # atexit.register(quit, False, False)
     # print debug information
     print("TestFunctions: Netedit opened successfully")
     # all keys up
@@ -447,7 +563,136 @@ def setupAndStart(testRoot, extraParameters=[], debugInformation=True, makeScren
     typeKeyUp("control")
     typeKeyUp("alt")
     # Wait for Netedit reference
-    return neteditProcess, getReferenceMatch(neteditProcess, makeScrenshot)
+    return getReferenceMatch(_NETEDIT_PROCESS, makeScrenshot)
+
+
+def setupAndStartPooled(testRoot, extraParameters=[], debugInformation=True, makeScrenshot=True):
+    """
+    @brief setup and start netedit reusing a process of the pool if possible (see recycle)
+    """
+    global _NETEDIT_PROCESS
+    # only processes started with exactly the same call (inputs, outputs and extra parameters) are reused
+    poolKey = tuple(buildNeteditCall(extraParameters, debugInformation))
+    while poolKey in _POOL and not _POOL[poolKey].empty():
+        neteditProcess = _POOL[poolKey].get()
+        # check that pooled netedit is still alive
+        if neteditProcess.poll() is not None:
+            continue
+        _NETEDIT_PROCESS = neteditProcess
+        # all keys up
+        typeKeyUp("shift")
+        typeKeyUp("control")
+        typeKeyUp("alt")
+        # reset netedit now that the sandbox contains the input files of the current test
+        resetPooled(neteditProcess)
+        # check if Netedit was crashed during reset
+        if neteditProcess.poll() is None:
+            print("TestFunctions: Netedit reused successfully")
+            # press i for inspect mode and click over reference (used to center view in window)
+            pyautogui.moveTo(neteditProcess.referencePosition)
+            time.sleep(DELAY_MOUSE_MOVE)
+            typeKey("i")
+            pyautogui.click(button='left')
+            time.sleep(DELAY_MOUSE_CLICK)
+            return neteditProcess, neteditProcess.referencePosition
+    referencePosition = setupAndStart(testRoot, extraParameters, debugInformation, makeScrenshot)
+    neteditProcess = _NETEDIT_PROCESS
+    # remember pool key and reference of the new process
+    neteditProcess.poolKey = poolKey
+    neteditProcess.referencePosition = referencePosition
+    return neteditProcess, referencePosition
+
+
+def answerNonSavedDialogs(openNetNonSavedDialog=False, saveNet=False,
+                          openAdditionalsNonSavedDialog=False, saveAdditionals=False,
+                          openDemandNonSavedDialog=False, saveDemandElements=False,
+                          openDataNonSavedDialog=False, saveDataElements=False):
+    """
+    @brief answer the non saved dialogs opened by closing the current network (same flags as reload and quit)
+    """
+    # Check if net must be saved
+    if openNetNonSavedDialog:
+        # Wait some seconds
+        time.sleep(DELAY_QUESTION)
+        if saveNet:
+            waitQuestion('s')
+            # wait for log
+            time.sleep(DELAY_RECOMPUTE)
+        else:
+            waitQuestion('q')
+    # Check if additionals, demand and data elements must be saved
+    for openDialog, save in ((openAdditionalsNonSavedDialog, saveAdditionals),
+                             (openDemandNonSavedDialog, saveDemandElements),
+                             (openDataNonSavedDialog, saveDataElements)):
+        if openDialog:
+            # Wait some seconds
+            time.sleep(DELAY_QUESTION)
+            waitQuestion('s' if save else 'q')
+
+
+def resetPooled(NeteditProcess):
+    """
+    @brief reset a pooled netedit to the input files of the current test (see recycle)
+    """
+    if '--new' in NeteditProcess.poolKey:
+        # start with a new network
+        pyautogui.moveTo(150, 200)
+        typeTwoKeys('ctrl', 'n')
+        # answer the non saved dialogs of the previous test
+        answerNonSavedDialogs(*NeteditProcess.resetFlags)
+        time.sleep(DELAY_RELOAD)
+    else:
+        # reload the input files (the sandbox was already refilled for the current test)
+        reload(*NeteditProcess.resetFlags, NeteditProcess=NeteditProcess)
+
+
+def recycle(NeteditProcess, openNetNonSavedDialog=False, saveNet=False,
+            openAdditionalsNonSavedDialog=False, saveAdditionals=False,
+            openDemandNonSavedDialog=False, saveDemandElements=False,
+            openDataNonSavedDialog=False, saveDataElements=False):
+    """
+    @brief return netedit to the pool instead of quitting it. The reset to the initial network is done by the next
+           setupAndStartPooled, once the sandbox contains the input files of the next test
+    """
+    # processes not started by setupAndStartPooled cannot be reused
+    if not hasattr(NeteditProcess, "poolKey"):
+        quit(openNetNonSavedDialog, saveNet, openAdditionalsNonSavedDialog, saveAdditionals,
+             openDemandNonSavedDialog, saveDemandElements, openDataNonSavedDialog, saveDataElements,
+             NeteditProcess)
+        return
+    # remember how the non saved dialogs of this test must be answered during the reset
+    NeteditProcess.resetFlags = (openNetNonSavedDialog, saveNet, openAdditionalsNonSavedDialog, saveAdditionals,
+                                 openDemandNonSavedDialog, saveDemandElements, openDataNonSavedDialog,
+                                 saveDataElements)
+    # check if Netedit was crashed during the test
+    if NeteditProcess.poll() is None:
+        _POOL.setdefault(NeteditProcess.poolKey, queue.Queue()).put(NeteditProcess)
+        print("TestFunctions: Netedit recycled successfully")
+
+
+@atexit.register
+def quitPool():
+    """
+    @brief quit all pooled netedit processes
+    """
+    for pool in _POOL.values():
+        while not pool.empty():
+            neteditProcess = pool.get()
+            # pooled processes still contain the changes of their last test
+            quit(*neteditProcess.resetFlags, NeteditProcess=neteditProcess)
+
+
+def runTest(testFunction, extraParameters=[], quitFlags=[]):
+    """
+    @brief start netedit, run test function and quit netedit (used if a test.py is executed as script).
+           quitFlags are the dialog flags of quit (NETEDIT_QUIT_FLAGS of the test)
+    """
+    # Open netedit
+    session = NeteditSession.start(NETEDIT_TEST_ROOT, extraParameters)
+    # run test
+    testFunction(session)
+    # quit netedit
+    session.quit(*quitFlags)
 
 
 def supermodeNetwork():
@@ -525,9 +770,10 @@ def undo(referencePosition, number, posX=0, posY=0):
     typeKey('i')
     # click over referencePosition
     leftClick(referencePosition, posX, posY)
-    for _ in range(number):
-        typeTwoKeys('ctrl', 'z')
-        time.sleep(DELAY_UNDOREDO)
+    # undo all operations in one key sequence
+    typeTwoKeysRepeated('ctrl', 'z', number)
+    # wait for every operation
+    time.sleep(DELAY_UNDOREDO * number)
 
 
 def redo(referencePosition, number, posX=0, posY=0):
@@ -542,9 +788,10 @@ def redo(referencePosition, number, posX=0, posY=0):
     typeKey('i')
     # click over referencePosition
     leftClick(referencePosition, posX, posY)
-    for _ in range(number):
-        typeTwoKeys('ctrl', 'y')
-        time.sleep(DELAY_UNDOREDO)
+    # redo all operations in one key sequence
+    typeTwoKeysRepeated('ctrl', 'y', number)
+    # wait for every operation
+    time.sleep(DELAY_UNDOREDO * number)
 
 
 def setZoom(positionX, positionY, zoomLevel):
@@ -580,13 +827,15 @@ def waitQuestion(answer):
     typeTwoKeys('alt', answer)
 
 
-def reload(NeteditProcess, openNetNonSavedDialog=False, saveNet=False,
+def reload(openNetNonSavedDialog=False, saveNet=False,
            openAdditionalsNonSavedDialog=False, saveAdditionals=False,
            openDemandNonSavedDialog=False, saveDemandElements=False,
-           openDataNonSavedDialog=False, saveDataElements=False):
+           openDataNonSavedDialog=False, saveDataElements=False, NeteditProcess=None):
     """
-    @brief reload Netedit
+    @brief reload Netedit (by default the one opened by setupAndStart)
     """
+    if NeteditProcess is None:
+        NeteditProcess = _NETEDIT_PROCESS
     # first move cursor out of magenta square
     pyautogui.moveTo(150, 200)
     # reload using hotkey
@@ -632,13 +881,15 @@ def reload(NeteditProcess, openNetNonSavedDialog=False, saveNet=False,
         print("TestFunctions: Error reloading Netedit")
 
 
-def quit(NeteditProcess, openNetNonSavedDialog=False, saveNet=False,
+def quit(openNetNonSavedDialog=False, saveNet=False,
          openAdditionalsNonSavedDialog=False, saveAdditionals=False,
          openDemandNonSavedDialog=False, saveDemandElements=False,
-         openDataNonSavedDialog=False, saveDataElements=False):
+         openDataNonSavedDialog=False, saveDataElements=False, NeteditProcess=None):
     """
-    @brief quit Netedit
+    @brief quit Netedit (by default the one opened by setupAndStart)
     """
+    if NeteditProcess is None:
+        NeteditProcess = _NETEDIT_PROCESS
     # check if Netedit is already closed
     if NeteditProcess.poll() is not None:
         # print debug information
@@ -927,6 +1178,21 @@ def createEdgeMode():
     time.sleep(DELAY_CHANGEMODE)
 
 
+def clickPath(referencePosition, positions, twoWay=False):
+    """
+    @brief create consecutive edges along the given positions (relative to referencePosition)
+           optionally toggling two-way mode before (chain mode must be disabled)
+    """
+    # toggle two-way mode
+    if twoWay:
+        changeEditMode(attrs.modes.network.twoWayMode)
+    # every edge is created clicking over its from and to position
+    edgePositions = []
+    for fromPosition, toPosition in zip(positions[:-1], positions[1:]):
+        edgePositions += [fromPosition, toPosition]
+    clickBatch(referencePosition, edgePositions)
+
+
 def cancelEdge():
     """
     @brief Cancel current created edge (used in chain mode)
@@ -1716,6 +1982,14 @@ def vehicleMode():
     # wait for gl debug
     time.sleep(DELAY_CHANGEMODE)
 
+
+def createFlow(referencePosition, fromX, fromY, toX, toY):
+    """
+    @brief create a flow (or vehicle) between the junctions/edges placed in the given positions
+    """
+    # click over from and to, then press enter to create flow
+    clickBatch(referencePosition, [(fromX, fromY), (toX, toY)], 'enter')
+
 #################################################
 # vType elements
 #################################################
@@ -2734,3 +3008,95 @@ def contextualMenuOperation(referencePosition, positionx, positiony, operation,
             pyautogui.hotkey('down')
     # select current operation
     typeSpace()
+
+#################################################
+# netedit session
+#################################################
+
+
+# operations whose first argument is an attribute of attributesEnum (given as "E1.inspect.lane")
+_ATTRIBUTE_OPERATIONS = set(["modifyAttribute", "modifyBoolAttribute", "modifyColorAttribute",
+                             "modifyAllowDisallowValue", "changeDefaultValue", "changeDefaultBoolValue"])
+
+
+def getAttributeEnum(path):
+    """
+    @brief obtain the value of an attribute of attributesEnum given its path (for example "E1.inspect.lane")
+    """
+    value = attrs
+    for name in path.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def execute(session, steps):
+    """
+    @brief execute a list of test steps (operation name followed by its arguments) in a netedit session.
+           Consecutive clicks are sent as a single batch and repeated saves are executed only once
+    """
+    clicks = []
+    previousStep = None
+    for step in steps:
+        operation = step[0]
+        # collect consecutive clicks
+        if operation == "leftClick":
+            clicks.append(step[1:])
+            previousStep = step
+            continue
+        if clicks:
+            session.clickBatch(clicks)
+            clicks = []
+        # skip repeated saves
+        if operation.startswith("save") and step == previousStep:
+            continue
+        previousStep = step
+        arguments = list(step[1:])
+        if operation in _ATTRIBUTE_OPERATIONS:
+            arguments[0] = getAttributeEnum(arguments[0])
+        if operation == "undoRedo":
+            session.undo(*arguments)
+            session.redo(*arguments)
+        else:
+            getattr(session, operation)(*arguments)
+    if clicks:
+        session.clickBatch(clicks)
+
+
+class NeteditSession:
+    """
+    @brief netedit process together with its reference position. Functions whose first parameter
+           is the reference position get it bound (session.leftClickShift(x, y)), all other
+           functions and attrs are accessed directly (session.inspectMode(), session.attrs...)
+    """
+
+    def __init__(self, neteditProcess, referencePosition):
+        self.proc = neteditProcess
+        self.ref = referencePosition
+
+    @classmethod
+    def start(cls, testRoot, extraParameters=[], debugInformation=True, makeScrenshot=True):
+        """
+        @brief setup and start netedit
+        """
+        referencePosition = setupAndStart(testRoot, extraParameters, debugInformation, makeScrenshot)
+        return cls(_NETEDIT_PROCESS, referencePosition)
+
+    def __getattr__(self, name):
+        attribute = getattr(sys.modules[__name__], name)
+        code = getattr(attribute, "__code__", None)
+        # bind reference position to the functions which take it as first parameter
+        if code is not None and code.co_argcount > 0 and code.co_varnames[0] == "referencePosition":
+            return functools.partial(attribute, self.ref)
+        return attribute
+
+    def execute(self, steps):
+        execute(self, steps)
+
+    def quit(self, *args, **kwargs):
+        quit(*args, NeteditProcess=self.proc, **kwargs)
+
+    def reload(self, *args, **kwargs):
+        reload(*args, NeteditProcess=self.proc, **kwargs)
+
+    def recycle(self, *args, **kwargs):
+        recycle(self.proc, *args, **kwargs)
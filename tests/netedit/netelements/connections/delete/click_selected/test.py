@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'], False)
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'], False)
 
 # Rebuild network
 netedit.rebuildNetwork()
@@ -62,4 +62,4 @@ netedit.redo(referencePosition, 1)
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
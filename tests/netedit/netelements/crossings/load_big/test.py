@@ -27,7 +27,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, [], False)
+referencePosition = netedit.setupAndStart(neteditTestRoot, [], False)
 
 # Rebuild network
 netedit.rebuildNetwork()
@@ -42,4 +42,4 @@ netedit.saveNetwork(referencePosition)
 time.sleep(30)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
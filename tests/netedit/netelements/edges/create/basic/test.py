@@ -15,63 +15,47 @@
 # @author  Pablo Alvarez Lopez
 # @date    2016-11-25
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
+# extra parameters used for opening netedit
+NETEDIT_ARGS = ['--new']
 
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
 
-# rebuild network
-netedit.rebuildNetwork()
+def test_main(session):
+    # rebuild network
+    session.rebuildNetwork()
 
-# Change to create mode
-netedit.createEdgeMode()
+    # Change to create mode
+    session.createEdgeMode()
 
-# Create two nodes
-netedit.leftClick(referencePosition, 80, 100)
-netedit.leftClick(referencePosition, 510, 100)
+    # Create two nodes
+    session.clickPath([(80, 100), (510, 100)])
 
-# Create another two nodes
-netedit.leftClick(referencePosition, 80, 100)
-netedit.leftClick(referencePosition, 510, 100)
-netedit.leftClick(referencePosition, 510, 100)
-netedit.leftClick(referencePosition, 80, 100)
+    # Create another two nodes
+    session.clickPath([(80, 100), (510, 100), (80, 100)])
 
-# select two-way mode
-netedit.changeEditMode(netedit.attrs.modes.network.twoWayMode)
+    # select two-way mode and create square
+    session.clickPath([(87, 292), (87, 400), (510, 400), (510, 292), (87, 292)], True)
 
-# create square
-netedit.leftClick(referencePosition, 87, 292)
-netedit.leftClick(referencePosition, 87, 400)
+    # rebuild network
+    session.rebuildNetwork()
 
-netedit.leftClick(referencePosition, 87, 400)
-netedit.leftClick(referencePosition, 510, 400)
+    # Check undo and redo
+    session.undo(7)
+    session.redo(7)
 
-netedit.leftClick(referencePosition, 510, 400)
-netedit.leftClick(referencePosition, 510, 292)
+    # rebuild network
+    session.rebuildNetwork()
 
-netedit.leftClick(referencePosition, 510, 292)
-netedit.leftClick(referencePosition, 87, 292)
+    # save network
+    session.saveNetwork()
 
-# rebuild network
-netedit.rebuildNetwork()
 
-# Check undo and redo
-netedit.undo(referencePosition, 7)
-netedit.redo(referencePosition, 7)
-
-# rebuild network
-netedit.rebuildNetwork()
-
-# save network
-netedit.saveNetwork(referencePosition)
-
-# quit netedit
-netedit.quit(neteditProcess)
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
@@ -15,52 +15,53 @@
 # @author  Pablo Alvarez Lopez
 # @date    2016-11-25
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
+# extra parameters used for opening netedit
+NETEDIT_ARGS = ['--new']
 
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--new'])
 
-# Change to create mode
-netedit.createEdgeMode()
+def test_main(session):
+    # attribute used in this test
+    disallowAttribute = session.attrs.edge.createLane.disallow
 
-# set attribute
-netedit.changeDefaultValue(netedit.attrs.edge.createLane.disallow, "dummy")
+    # Change to create mode
+    session.createEdgeMode()
 
-# Create two nodes
-netedit.leftClick(referencePosition, 80, 100)
-netedit.leftClick(referencePosition, 510, 100)
+    # set attribute
+    session.changeDefaultValue(disallowAttribute, "dummy")
 
-# set attribute
-netedit.changeDefaultValue(netedit.attrs.edge.createLane.disallow, "pedestrian bus")
+    # Create edge
+    session.clickPath([(80, 100), (510, 100)])
 
-# Create two nodes
-netedit.leftClick(referencePosition, 80, 175)
-netedit.leftClick(referencePosition, 500, 175)
+    # set attribute
+    session.changeDefaultValue(disallowAttribute, "pedestrian bus")
 
-# set attribute
-netedit.changeDefaultValue(netedit.attrs.edge.createLane.disallow, "all")
+    # Create edge
+    session.clickPath([(80, 175), (500, 175)])
 
-# Create two nodes
-netedit.leftClick(referencePosition, 80, 250)
-netedit.leftClick(referencePosition, 500, 250)
+    # set attribute
+    session.changeDefaultValue(disallowAttribute, "all")
 
-# Check undo and redo
-netedit.undo(referencePosition, 3)
-netedit.redo(referencePosition, 3)
+    # Create edge
+    session.clickPath([(80, 250), (500, 250)])
 
-# rebuild network
-netedit.rebuildNetwork()
+    # Check undo and redo
+    session.undo(3)
+    session.redo(3)
 
-# save network
-netedit.saveNetwork(referencePosition)
+    # rebuild network
+    session.rebuildNetwork()
 
-# quit netedit
-netedit.quit(neteditProcess)
+    # save network
+    session.saveNetwork()
+
+
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
@@ -15,63 +15,64 @@
 # @author  Pablo Alvarez Lopez
 # @date    2016-11-25
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
+# extra parameters used for opening netedit
+NETEDIT_ARGS = []
 
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
 
-# recompute
-netedit.rebuildNetwork()
+def test_main(session):
+    # attribute used in this test
+    widthAttribute = session.attrs.edge.inspect.width
 
-# force save additionals
-netedit.forceSaveAdditionals()
+    # recompute
+    session.rebuildNetwork()
 
-# go to inspect mode
-netedit.inspectMode()
+    # force save additionals
+    session.forceSaveAdditionals()
 
-# inspect edge
-netedit.leftClick(referencePosition, 250, 180)
+    # go to inspect mode
+    session.inspectMode()
 
-# Change parameter 16 with a non valid value (dummy)
-netedit.modifyAttribute(netedit.attrs.edge.inspect.width, "dummyWidth", False)
+    # inspect edge
+    session.leftClick(250, 180)
 
-# Change parameter 16 with a non valid value (empty)
-netedit.modifyAttribute(netedit.attrs.edge.inspect.width, "", False)
+    # Change parameter 16 with a non valid value (dummy)
+    session.modifyAttribute(widthAttribute, "dummyWidth", False)
 
-# Change parameter 16 with a non valid value (negative)
-netedit.modifyAttribute(netedit.attrs.edge.inspect.width, "-2", False)
+    # Change parameter 16 with a non valid value (empty)
+    session.modifyAttribute(widthAttribute, "", False)
 
-# Change parameter 16 with a valid value (default)
-netedit.modifyAttribute(netedit.attrs.edge.inspect.width, "default", False)
+    # Change parameter 16 with a non valid value (negative)
+    session.modifyAttribute(widthAttribute, "-2", False)
 
-# Change parameter 16 with a valid value (default)
-netedit.modifyAttribute(netedit.attrs.edge.inspect.width, "4", False)
+    # Change parameter 16 with a valid value (default)
+    session.modifyAttribute(widthAttribute, "default", False)
 
-# recompute
-netedit.rebuildNetwork()
+    # Change parameter 16 with a valid value (default)
+    session.modifyAttribute(widthAttribute, "4", False)
 
-# Check undos
-netedit.undo(referencePosition, 1)
+    # Check undos
+    session.undo(1)
 
-# recompute
-netedit.rebuildNetwork()
+    # check redos
+    session.redo(1)
 
-# check redos
-netedit.redo(referencePosition, 1)
+    # recompute
+    session.rebuildNetwork()
 
-# save additionals
-netedit.saveAdditionals(referencePosition)
+    # save additionals
+    session.saveAdditionals()
 
-# save network
-netedit.saveNetwork(referencePosition)
+    # save network
+    session.saveNetwork()
 
-# quit netedit
-netedit.quit(neteditProcess)
+
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
@@ -15,80 +15,76 @@
 # @author  Pablo Alvarez Lopez
 # @date    2016-11-25
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
+# extra parameters used for opening netedit
+NETEDIT_ARGS = []
 
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
 
-# recompute
-netedit.rebuildNetwork()
+def test_main(session):
+    # attribute used in this test
+    disallowAttribute = session.attrs.edge.inspectSelection.disallowed
 
-# force save additionals
-netedit.forceSaveAdditionals()
+    # recompute
+    session.rebuildNetwork()
 
-# go to select mode
-netedit.selectMode()
+    # force save additionals
+    session.forceSaveAdditionals()
 
-# select first edge
-netedit.leftClick(referencePosition, 250, 180)
+    # go to select mode
+    session.selectMode()
 
-# select second edge
-netedit.leftClick(referencePosition, 250, 110)
+    # select first edge
+    session.leftClick(250, 180)
 
-# go to inspect mode
-netedit.inspectMode()
+    # select second edge
+    session.leftClick(250, 110)
 
-# force save additionals
-netedit.forceSaveAdditionals()
+    # go to inspect mode
+    session.inspectMode()
 
-# inspect selected edges
-netedit.leftClick(referencePosition, 250, 180)
+    # inspect selected edges
+    session.leftClick(250, 180)
 
-# Change parameter 7 with an non valid value
-netedit.modifyAttribute(netedit.attrs.edge.inspectSelection.disallowed, "DummyDisallowed", False)
+    # Change parameter 7 with an non valid value
+    session.modifyAttribute(disallowAttribute, "DummyDisallowed", False)
 
-# Change parameter 7 with a valid value (empty)
-netedit.modifyAttribute(netedit.attrs.edge.inspectSelection.disallowed, "", False)
+    # Change parameter 7 with a valid value (empty)
+    session.modifyAttribute(disallowAttribute, "", False)
 
-# Change parameter 7 with a valid value (different separators)
-netedit.modifyAttribute(netedit.attrs.edge.inspectSelection.disallowed, "authority  army, passenger; taxi. tram", False)
+    # Change parameter 7 with a valid value (different separators)
+    session.modifyAttribute(disallowAttribute, session.VCLASS_SEP_TEST, False)
 
-# Change parameter 7 with a valid value (empty)
-netedit.modifyAttribute(netedit.attrs.edge.inspectSelection.disallowed, "", False)
+    # Change parameter 7 with a valid value (empty)
+    session.modifyAttribute(disallowAttribute, "", False)
 
-# Change parameter 8 with a valid value (empty)
-netedit.modifyAllowDisallowValue(netedit.attrs.edge.inspectSelection.disallowedButton, False)
+    # Change parameter 8 with a valid value (empty)
+    session.modifyAllowDisallowValue(session.attrs.edge.inspectSelection.disallowedButton, False)
 
-# Change parameter 7 with a valid value (empty)
-netedit.modifyAttribute(netedit.attrs.edge.inspectSelection.disallowed,
-                        "emergency authority army vip passenger hov bus coach tram rail_urban rail " +
-                        "rail_electric motorcycle moped pedestrian custom1", False)
+    # Change parameter 7 with a valid value (empty)
+    session.modifyAttribute(disallowAttribute, session.ALL_VCLASSES, False)
 
-# recompute
-netedit.rebuildNetwork()
+    # Check undos
+    session.undo(3)
 
-# Check undos
-netedit.undo(referencePosition, 3)
+    # check redos
+    session.redo(3)
 
-# recompute
-netedit.rebuildNetwork()
+    # recompute
+    session.rebuildNetwork()
 
-# check redos
-netedit.redo(referencePosition, 3)
+    # save additionals
+    session.saveAdditionals()
 
-# save additionals
-netedit.saveAdditionals(referencePosition)
+    # save network
+    session.saveNetwork()
 
-# save network
-netedit.saveNetwork(referencePosition)
 
-# quit netedit
-netedit.quit(neteditProcess)
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
@@ -27,7 +27,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, [])
+referencePosition = netedit.setupAndStart(neteditTestRoot, [])
 
 # rebuild network
 netedit.rebuildNetwork()
@@ -93,4 +93,4 @@ netedit.fixStoppingPlace("fixPositions")
 netedit.saveNetwork(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -15,77 +15,76 @@
 # @author  Pablo Alvarez Lopez
 # @date    2016-11-25
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
+# extra parameters used for opening netedit
+NETEDIT_ARGS = []
 
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
 
-# recompute
-netedit.rebuildNetwork()
+def test_main(session):
+    # attribute used in this test
+    disallowAttribute = session.attrs.lane.inspectSelection.disallow
 
-# force save additionals
-netedit.forceSaveAdditionals()
+    # recompute
+    session.rebuildNetwork()
 
-# toggle select lanes
-netedit.changeEditMode(netedit.attrs.modes.network.selectLane)
+    # force save additionals
+    session.forceSaveAdditionals()
 
-# go to select mode
-netedit.selectMode()
+    # toggle select lanes
+    session.changeEditMode(session.attrs.modes.network.selectLane)
 
-# select first lane
-netedit.leftClick(referencePosition, 250, 155)
+    # go to select mode
+    session.selectMode()
 
-# select second lane
-netedit.leftClick(referencePosition, 250, 95)
+    # select first lane
+    session.leftClick(250, 155)
 
-# go to inspect mode
-netedit.inspectMode()
+    # select second lane
+    session.leftClick(250, 95)
 
-# inspect lane
-netedit.leftClick(referencePosition, 250, 95)
+    # go to inspect mode
+    session.inspectMode()
 
-# Change parameter 2 with an non valid value
-netedit.modifyAttribute(netedit.attrs.lane.inspectSelection.disallow, "DummyDisallowed", True)
+    # inspect lane
+    session.leftClick(250, 95)
 
-# Change parameter 2 with a valid value (empty)
-netedit.modifyAttribute(netedit.attrs.lane.inspectSelection.disallow, "", True)
+    # Change parameter 2 with an non valid value
+    session.modifyAttribute(disallowAttribute, "DummyDisallowed", True)
 
-# Change parameter 2 with a valid value (different separators)
-netedit.modifyAttribute(netedit.attrs.lane.inspectSelection.disallow, "authority  army, passenger; taxi. tram", True)
+    # Change parameter 2 with a valid value (empty)
+    session.modifyAttribute(disallowAttribute, "", True)
 
-# Change parameter 2 with a valid value (empty)
-netedit.modifyAttribute(netedit.attrs.lane.inspectSelection.disallow, "", True)
+    # Change parameter 2 with a valid value (different separators)
+    session.modifyAttribute(disallowAttribute, session.VCLASS_SEP_TEST, True)
 
-# Change parameter 2 with a valid value (empty)
-netedit.modifyAttribute(netedit.attrs.lane.inspectSelection.disallow,
-                        "emergency authority army vip passenger hov bus coach tram rail_urban rail " +
-                        "rail_electric motorcycle moped pedestrian custom1", True)
+    # Change parameter 2 with a valid value (empty)
+    session.modifyAttribute(disallowAttribute, "", True)
 
-# recompute
-netedit.rebuildNetwork()
+    # Change parameter 2 with a valid value (empty)
+    session.modifyAttribute(disallowAttribute, session.ALL_VCLASSES, True)
 
-# Check undos
-netedit.undo(referencePosition, 1)
+    # Check undos
+    session.undo(1)
 
-# recompute
-netedit.rebuildNetwork()
+    # check redos
+    session.redo(1)
 
-# check redos
-netedit.redo(referencePosition, 1)
+    # recompute
+    session.rebuildNetwork()
 
-# save additionals
-netedit.saveAdditionals(referencePosition)
+    # save additionals
+    session.saveAdditionals()
 
-# save network
-netedit.saveNetwork(referencePosition)
+    # save network
+    session.saveNetwork()
 
-# quit netedit
-netedit.quit(neteditProcess)
+
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
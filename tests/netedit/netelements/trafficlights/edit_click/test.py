@@ -28,7 +28,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # force save additionals
 netedit.forceSaveAdditionals()
@@ -93,4 +93,4 @@ netedit.saveAdditionals(referencePosition)
 netedit.saveRoutes(referencePosition)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()
@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+# Eclipse SUMO, Simulation of Urban MObility; see https://eclipse.org/sumo
+# Copyright (C) 2009-2022 German Aerospace Center (DLR) and others.
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# https://www.eclipse.org/legal/epl-2.0/
+# This Source Code may also be made available under the following Secondary
+# Licenses when the conditions for such availability set forth in the Eclipse
+# Public License 2.0 are satisfied: GNU General Public License, version 2
+# or later which is available at
+# https://www.gnu.org/licenses/old-licenses/gpl-2.0-standalone.html
+# SPDX-License-Identifier: EPL-2.0 OR GPL-2.0-or-later
+
+# @file    run_parallel.py
+# @author  Pablo Alvarez Lopez
+# @date    2022-12-14
+
+"""
+Run netedit test scripts in parallel. Every worker process owns its own Xvfb
+display with the window manager and Xvfb arguments of the TextTest virtual
+display, so the GUI of one test never steals focus or key events from another.
+Every test runs in a fresh sandbox filled like the TextTest sandbox
+(see copy_test_path in config.netedit). The collated outputs of every test are
+compared against its *.netedit references using the filters and tolerances of
+config.netedit, which covers the plain forms of run_dependent_text used there
+({LINES n}, {[->]}, {REPLACE text} and {INTERNAL writedir}). TextTest remains
+the reference implementation of this comparison.
+"""
+from __future__ import print_function
+import argparse
+import difflib
+import glob
+import multiprocessing
+import multiprocessing.util
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+_NETEDIT_TEST_ROOT = os.path.dirname(os.path.abspath(__file__))
+_CONFIG = os.path.join(_NETEDIT_TEST_ROOT, "config.netedit")
+
+# display used by the current worker process
+_DISPLAY = None
+
+
+def readConfig():
+    """
+    @brief read config.netedit as a dictionary section -> list of (key, value), entries before the first section
+           are stored under ""
+    """
+    sections = {"": []}
+    section = ""
+    with open(_CONFIG) as config:
+        for line in config:
+            line = line.rstrip("\n")
+            if line.startswith("[") and line.endswith("]"):
+                section = line[1:-1]
+                sections.setdefault(section, [])
+            elif ":" in line:
+                sections[section].append(tuple(line.split(":", 1)))
+    return sections
+
+
+def getCopiedFiles():
+    """
+    @brief obtain the files TextTest copies into the sandbox of every test
+    """
+    copied = []
+    for key, fileName in readConfig()[""]:
+        if key.startswith("copy_test_path") and fileName.strip() not in copied:
+            copied.append(fileName.strip())
+    return copied
+
+
+def findInHierarchy(testDir, fileName):
+    """
+    @brief find the nearest file with the given name in the test hierarchy (None if there is none)
+    """
+    directory = testDir
+    while True:
+        path = os.path.join(directory, fileName)
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        # stop at the netedit test root or at the root of the filesystem
+        if parent == directory or os.path.samefile(directory, _NETEDIT_TEST_ROOT):
+            return None
+        directory = parent
+
+
+def fillSandbox(testDir, sandbox, copiedFiles):
+    """
+    @brief copy the input files of a test into its sandbox (the nearest file in the test hierarchy wins)
+    """
+    for fileName in copiedFiles:
+        source = findInHierarchy(testDir, fileName)
+        if source is not None:
+            shutil.copy(source, sandbox)
+
+
+def getComparison():
+    """
+    @brief obtain the collated files, run dependent filters and tolerances of config.netedit
+    """
+    config = readConfig()
+    # stdout and stderr of the script are collated as output and errors
+    collated = {"output": None, "errors": None}
+    for key, fileName in config.get("collate_file", []):
+        collated[key] = fileName
+    filters = {}
+    for key, pattern in config.get("run_dependent_text", []):
+        filters.setdefault(key, []).append(pattern)
+    tolerances = dict([(key, float(value)) for key, value in config.get("floating_point_tolerance", [])])
+    return collated, filters, tolerances
+
+
+def compileFilter(pattern):
+    """
+    @brief compile a run_dependent_text pattern (patterns which are no valid regular expression match literally)
+    """
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return re.compile(re.escape(pattern))
+
+
+def filterText(lines, filters, sandbox):
+    """
+    @brief apply the run_dependent_text filters of one collated file to its lines
+    """
+    for pattern in filters:
+        pattern = pattern.replace("{INTERNAL writedir}", re.escape(sandbox))
+        replace = None
+        numLines = 1
+        endPattern = None
+        match = re.search(r"\{REPLACE (.*)\}$", pattern)
+        if match:
+            pattern, replace = pattern[:match.start()], match.group(1)
+        match = re.search(r"\{LINES (\d+)\}$", pattern)
+        if match:
+            pattern, numLines = pattern[:match.start()], int(match.group(1))
+        if "{[->]}" in pattern:
+            pattern, endPattern = pattern.split("{[->]}", 1)
+            endPattern = compileFilter(endPattern)
+        pattern = compileFilter(pattern)
+        filtered = []
+        removeLines = 0
+        inBlock = False
+        for line in lines:
+            if inBlock:
+                inBlock = endPattern.search(line) is None
+            elif removeLines > 0:
+                removeLines -= 1
+            elif pattern.search(line):
+                if replace is not None:
+                    filtered.append(pattern.sub(lambda m: replace, line))
+                elif endPattern is not None:
+                    inBlock = endPattern.search(line, pattern.search(line).end()) is None
+                else:
+                    removeLines = numLines - 1
+            else:
+                filtered.append(line)
+        lines = filtered
+    return lines
+
+
+def linesEqual(line, reference, tolerance):
+    """
+    @brief compare two lines, numbers may differ by the given relative tolerance
+    """
+    if line == reference or not tolerance:
+        return line == reference
+    number = r"(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"
+    parts, referenceParts = re.split(number, line), re.split(number, reference)
+    if len(parts) != len(referenceParts):
+        return False
+    for index, (part, referencePart) in enumerate(zip(parts, referenceParts)):
+        if index % 2 == 0:
+            if part != referencePart:
+                return False
+        elif abs(float(part) - float(referencePart)) > tolerance * max(abs(float(referencePart)), 1e-12):
+            return False
+    return True
+
+
+def compareOutputs(testDir, sandbox, stdout, stderr):
+    """
+    @brief compare the collated outputs of a test with its *.netedit references, return the differences
+    """
+    collated, filters, tolerances = getComparison()
+    differences = []
+    for key in sorted(collated):
+        reference = findInHierarchy(testDir, "%s.netedit" % key)
+        if key == "output":
+            text = stdout
+        elif key == "errors":
+            text = stderr
+        elif os.path.isfile(os.path.join(sandbox, collated[key])):
+            with open(os.path.join(sandbox, collated[key]), errors="replace") as collatedFile:
+                text = collatedFile.read()
+        else:
+            text = None
+        if reference is None and not text:
+            continue
+        if reference is None:
+            differences.append("%s: new output without reference" % key)
+            continue
+        if text is None:
+            differences.append("%s: missing output %s" % (key, collated[key]))
+            continue
+        with open(reference, errors="replace") as referenceFile:
+            expected = filterText(referenceFile.read().splitlines(), filters.get(key, []), sandbox)
+        actual = filterText(text.splitlines(), filters.get(key, []), sandbox)
+        tolerance = tolerances.get(key, 0)
+        if len(actual) != len(expected) or not all([linesEqual(a, e, tolerance) for a, e in zip(actual, expected)]):
+            differences += ["%s: differs from reference" % key] + list(
+                difflib.unified_diff(expected, actual, "%s.netedit" % key, key, lineterm=""))
+    return "\n".join(differences)
+
+
+def stopDisplay(processes):
+    """
+    @brief stop the window manager and the Xvfb server of a worker
+    """
+    for process in reversed(processes):
+        if process.poll() is None:
+            process.terminate()
+            process.wait()
+
+
+def startDisplay(display, screen="1280x1024x24"):
+    """
+    @brief start a Xvfb server and the window manager for the given display, configured like the virtual display
+           of TextTest (see virtual_display_extra_args and virtual_display_wm_executable in config.netedit)
+    """
+    settings = dict(readConfig()[""])
+    xvfb = subprocess.Popen(["Xvfb", display, "-screen", "0", screen] +
+                            settings.get("virtual_display_extra_args", "").split(),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # wait for Xvfb
+    time.sleep(1)
+    processes = [xvfb]
+    windowManager = settings.get("virtual_display_wm_executable", "").strip()
+    if windowManager:
+        env = dict(os.environ)
+        env["DISPLAY"] = display
+        processes.append(subprocess.Popen([windowManager], env=env,
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        # wait for the window manager
+        time.sleep(1)
+    return processes
+
+
+def initWorker(workerIDs, displayOffset, screen):
+    """
+    @brief start the Xvfb server of a worker process
+    """
+    global _DISPLAY
+    _DISPLAY = ":%s" % (displayOffset + workerIDs.get())
+    processes = startDisplay(_DISPLAY, screen)
+    # terminate the window manager and Xvfb together with the worker
+    multiprocessing.util.Finalize(None, stopDisplay, args=(processes,), exitpriority=10)
+
+
+def runTest(testScript, copiedFiles, timeout):
+    """
+    @brief run a single test script in its own sandbox and return its results
+    """
+    testDir = os.path.dirname(testScript)
+    sandbox = tempfile.mkdtemp(prefix="netedit_")
+    fillSandbox(testDir, sandbox, copiedFiles)
+    env = dict(os.environ)
+    env["DISPLAY"] = _DISPLAY
+    env["TEXTTEST_SANDBOX"] = sandbox
+    env["TEXTTEST_HOME"] = os.path.dirname(_NETEDIT_TEST_ROOT)
+    start = time.time()
+    try:
+        result = subprocess.run([sys.executable, testScript], cwd=sandbox, env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                universal_newlines=True, timeout=timeout)
+        returnCode, stdout, stderr = result.returncode, result.stdout, result.stderr
+    except subprocess.TimeoutExpired as e:
+        returnCode = None
+        stdout = e.stdout.decode() if isinstance(e.stdout, bytes) else (e.stdout or "")
+        stderr = "timeout after %s seconds" % timeout
+    differences = compareOutputs(testDir, sandbox, stdout, stderr)
+    shutil.rmtree(sandbox, ignore_errors=True)
+    return testScript, returnCode, time.time() - start, stdout, stderr, differences
+
+
+def passed(result):
+    """
+    @brief check if a test exited normally and all its outputs match the references
+    """
+    return result[1] == 0 and not result[5]
+
+
+def writeJUnit(results, outFile):
+    """
+    @brief write the results of all tests as JUnit XML
+    """
+    failures = len([r for r in results if not passed(r)])
+    suite = ET.Element("testsuite", name="netedit", tests=str(len(results)), failures=str(failures),
+                       time="%.3f" % sum([r[2] for r in results]))
+    for testScript, returnCode, duration, stdout, stderr, differences in results:
+        name = os.path.relpath(os.path.dirname(testScript), _NETEDIT_TEST_ROOT).replace(os.sep, "/")
+        case = ET.SubElement(suite, "testcase", classname="netedit", name=name, time="%.3f" % duration)
+        if returnCode != 0:
+            failure = ET.SubElement(case, "failure", message="exit code %s" % returnCode)
+            failure.text = stderr
+        elif differences:
+            failure = ET.SubElement(case, "failure", message="output differs from reference")
+            failure.text = differences
+        ET.SubElement(case, "system-out").text = stdout
+        ET.SubElement(case, "system-err").text = stderr
+    ET.ElementTree(suite).write(outFile, encoding="utf-8", xml_declaration=True)
+
+
+def getOptions(args=None):
+    argParser = argparse.ArgumentParser(description=__doc__)
+    argParser.add_argument("tests", nargs="*", default=[_NETEDIT_TEST_ROOT],
+                           help="test directories or test scripts (default: all netedit tests)")
+    argParser.add_argument("-j", "--jobs", type=int, default=max(1, (os.cpu_count() or 1) - 2),
+                           help="number of worker processes (default: number of cores - 2)")
+    argParser.add_argument("-o", "--junit-xml", default="netedit-results.xml",
+                           help="output file for the JUnit XML results")
+    argParser.add_argument("--timeout", type=float, default=600,
+                           help="maximum run time in seconds for a single test")
+    argParser.add_argument("--display-offset", type=int, default=90,
+                           help="display number of the first worker")
+    argParser.add_argument("--screen", default="1280x1024x24",
+                           help="screen geometry of the Xvfb displays")
+    return argParser.parse_args(args)
+
+
+def main(options):
+    testScripts = []
+    for test in options.tests:
+        if os.path.isfile(test):
+            testScripts.append(os.path.abspath(test))
+        else:
+            testScripts += sorted(glob.glob(os.path.join(os.path.abspath(test), "**", "test.py"), recursive=True))
+    copiedFiles = getCopiedFiles()
+    workerIDs = multiprocessing.Manager().Queue()
+    for workerID in range(options.jobs):
+        workerIDs.put(workerID)
+    results = []
+    with ProcessPoolExecutor(max_workers=options.jobs, initializer=initWorker,
+                             initargs=(workerIDs, options.display_offset, options.screen)) as executor:
+        for result in executor.map(runTest, testScripts, [copiedFiles] * len(testScripts),
+                                   [options.timeout] * len(testScripts)):
+            print("%s %s (%.1fs)" % ("ok    " if passed(result) else "FAILED",
+                                     os.path.relpath(result[0], _NETEDIT_TEST_ROOT), result[2]))
+            results.append(result)
+    writeJUnit(results, options.junit_xml)
+    return 0 if all([passed(r) for r in results]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(getOptions()))
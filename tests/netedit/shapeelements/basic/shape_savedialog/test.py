@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # go to shape mode
 netedit.shapeMode()
@@ -41,4 +41,4 @@ netedit.createSquaredPoly(referencePosition, 100, 50, 100, True)
 netedit.saveNetwork(referencePosition)
 
 # quit netedit without saving shapes
-netedit.quit(neteditProcess, False, False, False, False, True, True)
+netedit.quit(False, False, False, False, True, True)
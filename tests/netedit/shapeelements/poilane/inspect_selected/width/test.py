@@ -15,52 +15,47 @@
 # @author  Pablo Alvarez Lopez
 # @date    2016-11-25
 
-# import common functions for netedit tests
 import os
 import sys
 
-testRoot = os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests')
-neteditTestRoot = os.path.join(
-    os.environ.get('TEXTTEST_HOME', testRoot), 'netedit')
-sys.path.append(neteditTestRoot)
-import neteditTestFunctions as netedit  # noqa
-
-# Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--gui-testing-debug-gl'])
-
-# go to select mode
-netedit.selectMode()
-
-# select first POILane
-netedit.leftClick(referencePosition, 140, 210)
-
-# select second POILane
-netedit.leftClick(referencePosition, 200, 210)
-
-# go to inspect mode
-netedit.inspectMode()
-
-# inspect first POILane
-netedit.leftClick(referencePosition, 140, 210)
-
-# Change parameter Width with a non valid value (dummy)
-netedit.modifyAttribute(netedit.attrs.POILane.inspectSelection.width, "dummyWidth", True)
-
-# Change parameter Width with a non valid value (negative)
-netedit.modifyAttribute(netedit.attrs.POILane.inspectSelection.width, "-2", True)
-
-# Change parameter Width with a valid value
-netedit.modifyAttribute(netedit.attrs.POILane.inspectSelection.width, "5.5", True)
-
-# Check undos and redos
-netedit.undo(referencePosition, 2)
-netedit.redo(referencePosition, 2)
-
-# save shapes
-netedit.saveAdditionals(referencePosition)
-
-# save network
-netedit.saveNetwork(referencePosition)
-
-# quit netedit
-netedit.quit(neteditProcess)
+# extra parameters used for opening netedit
+NETEDIT_ARGS = []
+
+# test steps (see neteditTestFunctions.execute)
+TEST = [
+    # go to select mode
+    ("selectMode",),
+    # select first POILane
+    ("leftClick", 140, 210),
+    # select second POILane
+    ("leftClick", 200, 210),
+    # go to inspect mode
+    ("inspectMode",),
+    # inspect first POILane
+    ("leftClick", 140, 210),
+    # Change parameter Width with a non valid value (dummy)
+    ("modifyAttribute", "POILane.inspectSelection.width", "dummyWidth", True),
+    # Change parameter Width with a non valid value (negative)
+    ("modifyAttribute", "POILane.inspectSelection.width", "-2", True),
+    # Change parameter Width with a valid value
+    ("modifyAttribute", "POILane.inspectSelection.width", "5.5", True),
+    # Check undos and redos
+    ("undoRedo", 2),
+    # save shapes
+    ("saveAdditionals",),
+    # save network
+    ("saveNetwork",),
+]
+
+
+def test_main(session):
+    session.execute(TEST)
+
+
+if __name__ == "__main__":
+    # import common functions for netedit tests
+    testRoot = os.environ.get('TEXTTEST_HOME', os.path.join(os.environ.get('SUMO_HOME', '.'), 'tests'))
+    sys.path.append(os.path.join(testRoot, 'netedit'))
+    import neteditTestFunctions as netedit  # noqa
+    # open netedit, run test and quit netedit
+    netedit.runTest(test_main, NETEDIT_ARGS)
@@ -26,7 +26,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot)
+referencePosition = netedit.setupAndStart(neteditTestRoot)
 
 # go to TAZ mode
 netedit.TAZMode()
@@ -38,4 +38,4 @@ netedit.createSquaredTAZ(referencePosition, 181, 129, 200, True)
 netedit.saveNetwork(referencePosition)
 
 # quit netedit without saving TAZs
-netedit.quit(neteditProcess, False, False, False, False, True, True)
+netedit.quit(False, False, False, False, True, True)
@@ -27,7 +27,7 @@ sys.path.append(neteditTestRoot)
 import neteditTestFunctions as netedit  # noqa
 
 # Open netedit
-neteditProcess, referencePosition = netedit.setupAndStart(neteditTestRoot, ['--sidewalks.guess'])
+referencePosition = netedit.setupAndStart(neteditTestRoot, ['--sidewalks.guess'])
 
 # Recompute with volatile options
 netedit.rebuildNetworkWithVolatileOptions()
@@ -48,4 +48,4 @@ netedit.saveNetwork(referencePosition)
 time.sleep(10)
 
 # quit netedit
-netedit.quit(neteditProcess)
+netedit.quit()